@@ -1,13 +1,25 @@
 import random
 
+VALID_VOTES = frozenset((-1, 0, 1))
+# Position of each vote in the aggregated [v_minus, v_zero, v_plus] buckets
+VOTE_BUCKETS = {-1: 0, 0: 1, 1: 2}
+
 class OBAF:
-    def __init__(self, args: list[str], atts: list[list[str]], agents: list[str], votes: dict[str, dict[str, int]]):
+    def __init__(self, args: list[str], atts: list[list[str]], agents: list[str], votes: dict[str, dict[str, int]], validate: bool = True):
         self.args = args
         self.atts = atts
         self.agents = agents
         self.votes = votes
-        # Check for any potential issues
-        self._validate()
+        # Check for any potential issues, unless the content comes from an already validated OBAF
+        if validate:
+            self._validate()
+
+    def with_attacks(self, atts: list[list[str]]) -> "OBAF":
+        """
+            Return a new OBAF with the given attacks, sharing the arguments, agents, and votes of this one.
+            Those were already validated when this OBAF was created, so validation is not run again.
+        """
+        return type(self)(self.args, atts, self.agents, self.votes, validate=False)
 
     def aggregate_votes(self, log = True) -> dict[str, list[int]]:
         """
@@ -19,15 +31,15 @@ class OBAF:
         aggregate_votes = {arg: [0, 0, 0] for arg in self.args}
         for _, arguments_dict in self.votes.items():
             for argument, vote in arguments_dict.items():
-                if argument in aggregate_votes:
-                    if vote == -1:
-                        aggregate_votes[argument][0] += 1
-                    elif vote == 0:
-                        aggregate_votes[argument][1] += 1
-                    elif vote == 1:
-                        aggregate_votes[argument][2] += 1
-                    else:
-                        raise ValueError(f"Invalid vote value: {vote}. Expected -1, 0, or 1.")
+                bucket = aggregate_votes.get(argument)
+                if bucket is None:
+                    continue
+                # Equal numbers hash alike, so a float vote such as 1.0 finds its bucket as well;
+                # other types are not looked up since unhashable values would raise TypeError
+                index = VOTE_BUCKETS.get(vote) if type(vote) in (int, float, bool) else None
+                if index is None:
+                    raise ValueError(f"Invalid vote value: {vote}. Expected -1, 0, or 1.")
+                bucket[index] += 1
         return aggregate_votes
     
     def generate_vote(self, agent: str, truth: list[str], reliability: float):
@@ -176,9 +188,10 @@ class OBAF:
         formatted_agts = "[" + ", ".join(f'\'{agent}\'' for agent in self.votes.keys()) + "]"
         # Format votes in nested structure: {agent: {argument: vote, ...}, ...}
         agent_votes_list = []
-        for agent in sorted(self.votes.keys()):
+        # Keys are unique, so sorting the items orders them by key and saves indexing back into the dicts
+        for agent, agent_votes in sorted(self.votes.items()):
             arg_votes = ", ".join(
-                f"{arg}: {self.votes[agent][arg]}" for arg in sorted(self.votes[agent].keys())
+                f"{arg}: {vote}" for arg, vote in sorted(agent_votes.items())
             )
             agent_votes_list.append(f"{agent}: {{{arg_votes}}}")
         formatted_votes = "{" + ", ".join(agent_votes_list) + "}"
@@ -194,32 +207,32 @@ class OBAF:
         """
         # Make sure every agent has a vote for every argument, filling in 0 for missing votes
         for agent in self.agents:
-            if agent not in self.votes:
+            agent_votes = self.votes.get(agent)
+            if agent_votes is None:
                 self.votes[agent] = {arg: 0 for arg in self.args}
             else:
                 for arg in self.args:
-                    if arg not in self.votes[agent]:
-                        self.votes[agent][arg] = 0
-        # Check for any invalid agents
+                    agent_votes.setdefault(arg, 0)
+        # Check for any invalid agents, membership is tested against sets since votes can be large
+        agents_set = set(self.agents)
         for agent in self.votes.keys():
-            if agent not in self.agents:
+            if agent not in agents_set:
                 raise ValueError(f"Agent '{agent}' has votes but is not declared in the agents list.")
         # Check for any invalid arguments in votes
+        arguments_set = set(self.args)
         for agent, arguments_dict in self.votes.items():
             for argument in arguments_dict.keys():
-                if argument not in self.args:
+                if argument not in arguments_set:
                     raise ValueError(f"Argument '{argument}' has votes from agent '{agent}' but is not declared in the arguments list.")
         # Check for any invalid vote values
         for agent, arguments_dict in self.votes.items():
             for argument, vote in arguments_dict.items():
-                if vote not in [-1, 0, 1]:
+                # Check the type first, unhashable values such as lists cannot be looked up in the set
+                if type(vote) not in (int, float, bool) or vote not in VALID_VOTES:
                     raise ValueError(f"Invalid vote value: {vote} from agent '{agent}' for argument '{argument}'. Expected -1, 0, or 1.")
-        # Check for duplicate votes (same agent voting on the same argument twice)
-        for agent, arguments_dict in self.votes.items():
-            for argument in arguments_dict.keys():
-                if list(arguments_dict.keys()).count(argument) > 1:
-                    raise ValueError(f"Duplicate vote from agent '{agent}' for argument '{argument}'.")
-                
+        # Duplicate votes (same agent voting on the same argument twice) cannot occur here,
+        # each agent's votes are a dict keyed by argument; the parsers reject them while reading
+
 if __name__ == "__main__":
     # More complex example usage
     args = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j']
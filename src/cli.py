@@ -1,22 +1,23 @@
 from __future__ import annotations
 
 import argparse
-import ast
+import functools
+import json
 import logging
+import operator
+import os
+import sys
 from pathlib import Path
 
-from OBAF import OBAF
-from af_to_obaf_script import convert_af_to_obaf, run_algorithms_on_all_obafs
-from cosar import run as run_cosar
-from css import run as run_css
-from graph import plot_graph
+from OBAF import OBAF, VALID_VOTES
 from parser import read_apx, write_apx
-from pygarg.dung import solver
 
 COMMANDS = {"run", "convert", "eval", "plot"}
 VALID_RUN_SEMANTICS = {"CF", "AD", "ST", "CO", "PR", "GR", "ID", "SST"}
 VALID_PLOT_SEMANTICS = {"all", "PR", "CO"}
 VALID_PLOT_DISTRIBUTIONS = {"all", "uniform", "average"}
+VALID_CSS_MEASURES = frozenset({"S", "D", "U"})
+VALID_CSS_AGGREGATIONS = frozenset({"sum", "min", "leximax", "leximin"})
 VALID_AGENT_PRESETS = {
     (5,),
     (5, 10),
@@ -25,9 +26,11 @@ VALID_AGENT_PRESETS = {
     (5, 10, 15, 20, 25),
     (5, 10, 15, 20, 25, 30),
 }
+APX_SUFFIX = ".apx"
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 TEST_DATA_DIR = PROJECT_ROOT / "data" / "test"
+RESULTS_DIR = TEST_DATA_DIR / "results"
 DEFAULT_METADATA_PATH = PROJECT_ROOT / "data" / "OBAF" / "obaf_metadata.csv"
 
 
@@ -48,7 +51,11 @@ def _setup_logger() -> logging.Logger:
 def _list_test_files() -> list[Path]:
     if not TEST_DATA_DIR.is_dir():
         return []
-    return sorted(path for path in TEST_DATA_DIR.glob("*.apx") if path.is_file())
+    # DirEntry.is_file() reuses the type info returned by readdir, so no extra stat() per regular file
+    with os.scandir(TEST_DATA_DIR) as it:
+        entries = [entry for entry in it if entry.name.endswith(APX_SUFFIX) and entry.is_file()]
+    entries.sort(key=operator.attrgetter("name"))
+    return [Path(entry.path) for entry in entries]
 
 
 def _parse_agent_counts(raw_value: str) -> list[int]:
@@ -69,6 +76,7 @@ def _parse_agent_counts(raw_value: str) -> list[int]:
     return counts
 
 
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run analyses, batch conversion, scoring, or plotting for the TER project."
@@ -92,34 +100,54 @@ def _build_parser() -> argparse.ArgumentParser:
         type=str,
         help="APX file path or file name in data/test/.",
     )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        help="Several APX file paths or file names in data/test/, run one after another in this process.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        help="Text file listing one APX file path or file name per line, run like --files.",
+    )
     parser.add_argument(
         "--args",
         dest="custom_args",
         type=str,
-        help='Custom arguments as Python literal list, e.g. ["a", "b"].',
+        help='Custom arguments as a JSON list (Python literals are also accepted), e.g. ["a", "b"].',
     )
     parser.add_argument(
         "--atts",
         dest="custom_atts",
         type=str,
-        help='Custom attacks as Python literal list, e.g. [["a", "b"], ["b", "c"]].',
+        help='Custom attacks as a JSON list of pairs (Python literals are also accepted), e.g. [["a", "b"], ["b", "c"]].',
     )
     parser.add_argument(
         "--votes",
         dest="custom_votes",
         type=str,
-        help='Custom votes as Python literal nested dict, e.g. {"A": {"a": 1, "b": -1}, "B": {"c": 1}}.',
+        help='Custom votes as a JSON nested object (Python literals are also accepted), e.g. {"A": {"a": 1, "b": -1}, "B": {"c": 1}}.',
     )
     parser.add_argument(
         "--no-write",
         action="store_true",
         help="Do not write the resulting .apx file to data/test/results (COSAR mode).",
     )
+    parser.add_argument(
+        "--no-display",
+        action="store_true",
+        help="Do not print the resulting argumentation system (COSAR mode).",
+    )
     parser.add_argument(
         "--show-input",
         action="store_true",
         help="Display parsed input before running the selected algorithm.",
     )
+    parser.add_argument(
+        "--show-initial",
+        action="store_true",
+        help="Also compute and display the extensions of the input framework (always done in CSS mode).",
+    )
     parser.add_argument(
         "--semantics",
         default="PR",
@@ -134,13 +162,13 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--measure",
         default="U",
-        choices=["S", "D", "U"],
+        choices=sorted(VALID_CSS_MEASURES),
         help="CSS measure: S, D, or U.",
     )
     parser.add_argument(
         "--agg",
         default="sum",
-        choices=["sum", "min", "leximax", "leximin"],
+        choices=sorted(VALID_CSS_AGGREGATIONS),
         help="CSS aggregation function.",
     )
 
@@ -170,13 +198,17 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def _validate_custom_input(parser: argparse.ArgumentParser, cli_args: argparse.Namespace) -> bool:
-    custom_values = (cli_args.custom_args, cli_args.custom_atts, cli_args.custom_votes)
-    use_custom_input = any(value is not None for value in custom_values)
-    if use_custom_input and not all(value is not None for value in custom_values):
+    custom_args, custom_atts, custom_votes = cli_args.custom_args, cli_args.custom_atts, cli_args.custom_votes
+    use_custom_input = custom_args is not None or custom_atts is not None or custom_votes is not None
+    if use_custom_input and (custom_args is None or custom_atts is None or custom_votes is None):
         parser.error("When using custom input, provide --args, --atts, and --votes together.")
     return use_custom_input
 
 
+def _read_choice(prompt: str) -> str:
+    return input(prompt).strip().lower()
+
+
 def _select_and_validate_semantics(cli_args: argparse.Namespace) -> None:
     while True:
         prompt = f"\nSet semantics CF/AD/ST/CO/PR/GR/ID/SST [{cli_args.semantics}]: "
@@ -196,7 +228,7 @@ def _select_algorithm_interactively(default_algorithm: str) -> str:
         print("  1  cosar")
         print("  2  css")
         print(f"  Enter  Keep current default ({default_algorithm})")
-        choice = input("> ").strip().lower()
+        choice = _read_choice("> ")
 
         if choice in ("", "enter"):
             return default_algorithm
@@ -212,9 +244,7 @@ def _select_cosar_parameters_interactively(cli_args: argparse.Namespace) -> None
     print("\nConfigure COSAR aggregation:")
 
     while True:
-        method = input(
-            f"  Aggregation base/neutral-aware/wct/bayesian [{cli_args.aggregation_method}]: "
-        ).strip().lower()
+        method = _read_choice(f"  Aggregation base/neutral-aware/wct/bayesian [{cli_args.aggregation_method}]: ")
         if not method:
             break
         if method in {"base", "neutral-aware", "wct", "bayesian"}:
@@ -230,72 +260,92 @@ def _select_css_parameters_interactively(cli_args: argparse.Namespace) -> None:
         measure = input(f"  Measure S/D/U [{cli_args.measure}]: ").strip().upper()
         if not measure:
             break
-        if measure in {"S", "D", "U"}:
+        if measure in VALID_CSS_MEASURES:
             cli_args.measure = measure
             break
         print("  Invalid measure. Choose S, D, or U.")
 
     while True:
-        agg = input(f"  Aggregation sum/min/leximax/leximin [{cli_args.agg}]: ").strip().lower()
+        agg = _read_choice(f"  Aggregation sum/min/leximax/leximin [{cli_args.agg}]: ")
         if not agg:
             break
-        if agg in {"sum", "min", "leximax", "leximin"}:
+        if agg in VALID_CSS_AGGREGATIONS:
             cli_args.agg = agg
             break
         print("  Invalid aggregation. Choose sum, min, leximax, or leximin.")
 
 
+def _switch_algorithm_from_menu(cli_args: argparse.Namespace) -> None:
+    cli_args.algorithm = _select_algorithm_interactively(cli_args.algorithm)
+    if cli_args.algorithm == "cosar":
+        _select_cosar_parameters_interactively(cli_args)
+    elif cli_args.algorithm == "css":
+        _select_css_parameters_interactively(cli_args)
+
+
+def _configure_css_from_menu(cli_args: argparse.Namespace) -> None:
+    if cli_args.algorithm != "css":
+        print("CSS parameters are only available when algorithm is css.")
+        return
+    _select_css_parameters_interactively(cli_args)
+
+
+def _configure_cosar_from_menu(cli_args: argparse.Namespace) -> None:
+    if cli_args.algorithm != "cosar":
+        print("COSAR aggregation is only available when algorithm is cosar.")
+        return
+    _select_cosar_parameters_interactively(cli_args)
+
+
+# Single-letter menu commands, dispatched with one dict lookup instead of an if/elif ladder
+MENU_ACTIONS = {
+    "a": _switch_algorithm_from_menu,
+    "s": _select_and_validate_semantics,
+    "p": _configure_css_from_menu,
+    "m": _configure_cosar_from_menu,
+}
+
+
+def _render_option_menu(cli_args: argparse.Namespace) -> str:
+    lines = [
+        "",
+        "Choose an option:",
+        "  <number>   Run this file",
+        "  v<number>  View parsed content of this file",
+        "  a          Switch algorithm",
+        f"  s          Set semantics (current: {cli_args.semantics})",
+    ]
+    if cli_args.algorithm == "cosar":
+        lines.append("  m          Configure COSAR aggregation")
+        lines.append(f"             (aggregation={cli_args.aggregation_method})")
+    if cli_args.algorithm == "css":
+        lines.append("  p          Configure CSS parameters")
+        lines.append(f"             (measure={cli_args.measure}, agg={cli_args.agg})")
+    lines.append("  q          Quit")
+    return "\n".join(lines) + "\n"
+
+
 def _select_file_interactively(files: list[Path], cli_args: argparse.Namespace) -> Path:
     if not files:
         raise ValueError("No .apx files available in data/test.")
 
+    # The file list never changes during the session, only the option lines below it do
+    file_menu = "\nAvailable data files:\n" + "".join(
+        f"  {index}. {file_path.name}\n" for index, file_path in enumerate(files, start=1)
+    )
+
     while True:
-        print("\nAvailable data files:")
-        for index, file_path in enumerate(files, start=1):
-            print(f"  {index}. {file_path.name}")
-
-        print("\nChoose an option:")
-        print("  <number>   Run this file")
-        print("  v<number>  View parsed content of this file")
-        print("  a          Switch algorithm")
-        print(f"  s          Set semantics (current: {cli_args.semantics})")
-        if cli_args.algorithm == "cosar":
-            print("  m          Configure COSAR aggregation")
-            print(f"             (aggregation={cli_args.aggregation_method})")
-        if cli_args.algorithm == "css":
-            print("  p          Configure CSS parameters")
-            print(f"             (measure={cli_args.measure}, agg={cli_args.agg})")
-        print("  q          Quit")
-
-        choice = input("> ").strip().lower()
+        sys.stdout.write(file_menu + _render_option_menu(cli_args))
+        sys.stdout.flush()
+
+        choice = _read_choice("> ")
 
         if choice == "q":
             raise SystemExit(0)
 
-        if choice == "a":
-            cli_args.algorithm = _select_algorithm_interactively(cli_args.algorithm)
-            if cli_args.algorithm == "cosar":
-                _select_cosar_parameters_interactively(cli_args)
-            elif cli_args.algorithm == "css":
-                _select_css_parameters_interactively(cli_args)
-            continue
-
-        if choice == "s":
-            _select_and_validate_semantics(cli_args)
-            continue
-
-        if choice == "p":
-            if cli_args.algorithm != "css":
-                print("CSS parameters are only available when algorithm is css.")
-                continue
-            _select_css_parameters_interactively(cli_args)
-            continue
-
-        if choice == "m":
-            if cli_args.algorithm != "cosar":
-                print("COSAR aggregation is only available when algorithm is cosar.")
-                continue
-            _select_cosar_parameters_interactively(cli_args)
+        menu_action = MENU_ACTIONS.get(choice)
+        if menu_action is not None:
+            menu_action(cli_args)
             continue
 
         if choice.startswith("v"):
@@ -326,21 +376,37 @@ def _select_file_interactively(files: list[Path], cli_args: argparse.Namespace)
         return files[index - 1]
 
 
+def _resolve_file_argument(parser: argparse.ArgumentParser, raw_path: str) -> Path:
+    # TEST_DATA_DIR and PROJECT_ROOT are already resolved, so a single isfile() check per candidate is enough
+    if os.path.isabs(raw_path):
+        candidates = (raw_path,)
+    else:
+        candidates = (TEST_DATA_DIR / raw_path, PROJECT_ROOT / raw_path)
+
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return Path(candidate)
+    parser.error(f"File not found: {raw_path}")
+
+
+def _resolve_batch_files(parser: argparse.ArgumentParser, cli_args: argparse.Namespace) -> list[Path]:
+    raw_paths = list(cli_args.files or [])
+    if cli_args.batch:
+        if not os.path.isfile(cli_args.batch):
+            parser.error(f"Batch file not found: {cli_args.batch}")
+        # One APX path per line, resolved like --file
+        with open(cli_args.batch, "r", encoding="utf-8") as batch_file:
+            raw_paths.extend(line.strip() for line in batch_file if line.strip())
+    return [_resolve_file_argument(parser, raw_path) for raw_path in raw_paths]
+
+
 def _resolve_selected_file(
     parser: argparse.ArgumentParser,
     cli_args: argparse.Namespace,
     files: list[Path],
 ) -> Path:
     if cli_args.file:
-        candidate = Path(cli_args.file)
-        if not candidate.is_absolute():
-            candidate_in_test = TEST_DATA_DIR / cli_args.file
-            candidate = candidate_in_test if candidate_in_test.exists() else (PROJECT_ROOT / cli_args.file)
-
-        selected_file = candidate.resolve()
-        if not selected_file.exists() or not selected_file.is_file():
-            parser.error(f"File not found: {cli_args.file}")
-        return selected_file
+        return _resolve_file_argument(parser, cli_args.file)
 
     cli_args.algorithm = _select_algorithm_interactively(cli_args.algorithm)
     _select_and_validate_semantics(cli_args)
@@ -353,22 +419,35 @@ def _resolve_selected_file(
     return _select_file_interactively(files, cli_args)
 
 
+def _load_literal(raw_value: str):
+    # json.loads is implemented in C; only tuples and other Python-only syntax need the ast fallback
+    try:
+        return json.loads(raw_value)
+    except json.JSONDecodeError:
+        pass
+    import ast
+
+    return ast.literal_eval(raw_value)
+
+
 def _parse_custom_args(raw_args: str) -> list[str]:
-    parsed = ast.literal_eval(raw_args)
-    if not isinstance(parsed, list) or not all(isinstance(item, str) for item in parsed):
-        raise ValueError('--args must be a Python list of strings, e.g. ["a", "b"].')
+    parsed = _load_literal(raw_args)
+    # JSON arrays may still hold numbers or nested lists, so element types are always checked,
+    # but map/set keep that check in C instead of a generator
+    if not isinstance(parsed, list) or not set(map(type, parsed)) <= {str}:
+        raise ValueError('--args must be a JSON list of strings, e.g. ["a", "b"].')
     return parsed
 
 
 def _parse_custom_atts(raw_atts: str) -> list[list[str]]:
-    parsed = ast.literal_eval(raw_atts)
+    parsed = _load_literal(raw_atts)
     if not isinstance(parsed, list):
-        raise ValueError("--atts must be a Python list.")
+        raise ValueError('--atts must be a JSON list of pairs, e.g. [["a", "b"], ["b", "c"]].')
 
     normalized: list[list[str]] = []
     for item in parsed:
         if not isinstance(item, (list, tuple)) or len(item) != 2:
-            raise ValueError("Each attack must contain exactly two strings, e.g. ['a', 'b'].")
+            raise ValueError('Each attack must contain exactly two strings, e.g. ["a", "b"].')
         attacker, target = item
         if not isinstance(attacker, str) or not isinstance(target, str):
             raise ValueError("Each attack must contain string values.")
@@ -377,24 +456,25 @@ def _parse_custom_atts(raw_atts: str) -> list[list[str]]:
 
 
 def _parse_custom_votes(raw_votes: str) -> dict[str, dict[str, int]]:
-    parsed = ast.literal_eval(raw_votes)
+    parsed = _load_literal(raw_votes)
     if not isinstance(parsed, dict):
-        raise ValueError("--votes must be a Python dict, e.g. {'A': {'a': 1, 'b': -1}}.")
+        raise ValueError('--votes must be a JSON object, e.g. {"A": {"a": 1, "b": -1}}.')
 
     normalized: dict[str, dict[str, int]] = {}
     for agent, argument_votes in parsed.items():
-        if not isinstance(agent, str):
+        if type(agent) is not str:
             raise ValueError("Agent names must be strings.")
         if not isinstance(argument_votes, dict):
-            raise ValueError("Each agent value must be a dict of {argument: vote}.")
+            raise ValueError('Each agent value must be an object of {"argument": vote}.')
 
-        normalized[agent] = {}
+        agent_votes = normalized[agent] = {}
         for argument, value in argument_votes.items():
-            if not isinstance(argument, str):
+            if type(argument) is not str:
                 raise ValueError("Argument names must be strings.")
-            if value not in (-1, 0, 1):
+            # Check the type first, unhashable values such as lists cannot be looked up in the set
+            if type(value) not in (int, float, bool) or value not in VALID_VOTES:
                 raise ValueError("Vote values must be -1, 0, or 1.")
-            normalized[agent][argument] = int(value)
+            agent_votes[argument] = int(value)
     return normalized
 
 
@@ -405,43 +485,71 @@ def _build_custom_obaf(args: list[str], atts: list[list[str]], votes: dict[str,
 
 def _print_extensions(title: str, extensions) -> None:
     normalized_extensions = [extensions] if isinstance(extensions, (set, frozenset)) else list(extensions)
-    print(f"\n{title}:")
+    # Build the whole block and write it at once, there can be thousands of extensions
+    parts = [f"\n{title}:\n"]
     if not normalized_extensions:
-        print("(none)")
-        return
-    for extension in normalized_extensions:
-        print("{" + ", ".join(sorted(extension)) + "}")
+        parts.append("(none)\n")
+    else:
+        parts.extend("{" + ", ".join(sorted(extension)) + "}\n" for extension in normalized_extensions)
+    sys.stdout.write("".join(parts))
 
 
 def _run_analysis_workflow(parser: argparse.ArgumentParser, cli_args: argparse.Namespace, logger: logging.Logger) -> None:
-    files = _list_test_files()
-
     print("Welcome to COSAR/CSS CLI")
     print("Start by choosing an algorithm.")
 
     use_custom_input = _validate_custom_input(parser, cli_args)
+    use_batch = bool(cli_args.files or cli_args.batch)
+    if use_batch and (use_custom_input or cli_args.file):
+        parser.error("--files/--batch cannot be combined with --file or custom input.")
+
     if use_custom_input:
-        source_name = "custom_input"
         args = _parse_custom_args(cli_args.custom_args)
         atts = _parse_custom_atts(cli_args.custom_atts)
         votes = _parse_custom_votes(cli_args.custom_votes)
         obaf = _build_custom_obaf(args, atts, votes)
         logger.info("Using custom input with %d arguments and %d agents.", len(obaf.args), len(obaf.agents))
-    else:
-        selected_file = _resolve_selected_file(parser, cli_args, files)
-        source_name = selected_file.name
-        logger.info("Selected file: %s", selected_file)
-        obaf = read_apx(str(selected_file))
+        _run_on_obaf(parser, cli_args, logger, obaf, "custom_input")
+        return
+
+    if use_batch:
+        # Parser, imports and the APX cache are shared by every file of the batch
+        batch_files = _resolve_batch_files(parser, cli_args)
+        for selected_file in batch_files:
+            logger.info("Selected file: %s", selected_file)
+            obaf = read_apx(str(selected_file))
+            _run_on_obaf(parser, cli_args, logger, obaf, selected_file.name)
+        return
+
+    selected_file = _resolve_selected_file(parser, cli_args, _list_test_files())
+    logger.info("Selected file: %s", selected_file)
+    obaf = read_apx(str(selected_file))
+    _run_on_obaf(parser, cli_args, logger, obaf, selected_file.name)
 
+
+def _run_on_obaf(
+    parser: argparse.ArgumentParser,
+    cli_args: argparse.Namespace,
+    logger: logging.Logger,
+    obaf: OBAF,
+    source_name: str,
+) -> None:
     if cli_args.show_input:
         print("\nInput argumentation system:")
         obaf.__str__()
 
-    logger.info("Computing initial extensions for semantics %s.", cli_args.semantics)
-    initial_extensions = solver.extension_enumeration(obaf.args, obaf.atts, cli_args.semantics)
-    _print_extensions("Initial extension(s) for selected semantics", initial_extensions)
+    # Solver and algorithm modules are imported on first use so other workflows and --help stay fast
+    from pygarg.dung import solver
+
+    # CSS ranks the initial extensions; for COSAR they are only informative and cost a full enumeration
+    if cli_args.algorithm == "css" or cli_args.show_initial:
+        logger.info("Computing initial extensions for semantics %s.", cli_args.semantics)
+        initial_extensions = solver.extension_enumeration(obaf.args, obaf.atts, cli_args.semantics)
+        _print_extensions("Initial extension(s) for selected semantics", initial_extensions)
 
     if cli_args.algorithm == "cosar":
+        from cosar import run as run_cosar
+
         logger.info("Running COSAR with aggregation method %s.", cli_args.aggregation_method)
         extensions, pruned_obaf = run_cosar(
             obaf,
@@ -449,8 +557,9 @@ def _run_analysis_workflow(parser: argparse.ArgumentParser, cli_args: argparse.N
             aggregation_method=cli_args.aggregation_method,
         )
 
-        print("\nResulting argumentation system:")
-        pruned_obaf.__str__()
+        if not cli_args.no_display:
+            print("\nResulting argumentation system:")
+            pruned_obaf.__str__()
 
         if cli_args.no_write:
             logger.info("Skipping COSAR output file creation (--no-write).")
@@ -459,9 +568,8 @@ def _run_analysis_workflow(parser: argparse.ArgumentParser, cli_args: argparse.N
 
         _print_extensions("Best extension(s) according to COSAR", extensions)
 
-        results_dir = PROJECT_ROOT / "data" / "test" / "results"
-        results_dir.mkdir(parents=True, exist_ok=True)
-        output_path = (results_dir / f"{source_name}_result.apx").resolve()
+        # write_apx creates RESULTS_DIR if it is missing
+        output_path = RESULTS_DIR / f"{source_name}_result.apx"
         write_apx(str(output_path), pruned_obaf)
         return
 
@@ -471,6 +579,8 @@ def _run_analysis_workflow(parser: argparse.ArgumentParser, cli_args: argparse.N
             print("No extension found for this semantics.")
             return
 
+        from css import run as run_css
+
         logger.info("Running CSS with measure=%s and agg=%s.", cli_args.measure, cli_args.agg)
         extensions = run_css(
             initial_extensions,
@@ -489,18 +599,24 @@ def _run_analysis_workflow(parser: argparse.ArgumentParser, cli_args: argparse.N
 
 
 def _run_convert_workflow(logger: logging.Logger) -> None:
+    from af_to_obaf_script import convert_af_to_obaf
+
     logger.info("Starting AF to OBAF conversion.")
     convert_af_to_obaf()
     logger.info("AF to OBAF conversion finished.")
 
 
 def _run_eval_workflow(logger: logging.Logger) -> None:
+    from af_to_obaf_script import run_algorithms_on_all_obafs
+
     logger.info("Starting OBAF scoring run.")
     run_algorithms_on_all_obafs()
     logger.info("OBAF scoring run finished.")
 
 
 def _run_plot_workflow(cli_args: argparse.Namespace, logger: logging.Logger) -> None:
+    from graph import plot_graph
+
     agent_counts = _parse_agent_counts(cli_args.plot_agents)
     logger.info(
         "Starting graph generation: metadata=%s semantics=%s agents=%s distribution=%s",
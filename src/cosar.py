@@ -1,12 +1,13 @@
-from pygarg.dung import solver
 from OBAF import OBAF
 
-def compute_scores(obaf: OBAF) -> dict[str, float]:
+def compute_scores(obaf: OBAF, aggregate_votes: dict[str, list[int]] | None = None) -> dict[str, float]:
     """
-        Aggregate the score of each argument using the formula given in the paper.    
+        Aggregate the score of each argument using the formula given in the paper.
+        Already aggregated votes can be passed to avoid counting them again.
     """
     EPS = 0.1
-    aggregate_votes = obaf.aggregate_votes()
+    if aggregate_votes is None:
+        aggregate_votes = obaf.aggregate_votes()
     scores = {}
     for arg, votes in aggregate_votes.items():
         v_minus, _, v_plus = votes
@@ -20,9 +21,9 @@ def compute_neutral_aware_score(obaf: OBAF) -> dict[str, float]:
     """
         Compute the neutral-aware score of each argument using the formula given in definitions.md. 
     """
-    # Start by computing the base scores using the original formula
-    base_scores = compute_scores(obaf)
+    # Start by computing the base scores using the original formula, counting the votes only once
     aggregate_votes = obaf.aggregate_votes()
+    base_scores = compute_scores(obaf, aggregate_votes)
     scores = {}
 
     for arg, votes in aggregate_votes.items():
@@ -65,11 +66,8 @@ def prune_attacks(atts: list[list[str]], scores: dict[str, float]) -> list[list[
     """
         Prune the attacks based on the scores of the arguments. If an argument with a lower score attacks an argument with a higher score, the attack is pruned.
     """
-    pruned_atts = []
-    for attacker, target in atts:
-        if scores[attacker] >= scores[target]:
-            pruned_atts.append([attacker, target])
-    return pruned_atts
+    # Keep the existing attack pairs instead of building new ones, nothing mutates them afterwards
+    return [att for att in atts if scores[att[0]] >= scores[att[1]]]
 
         
 def run(obaf: OBAF, semantics, aggregation_method="base", log = True):
@@ -97,13 +95,14 @@ def run(obaf: OBAF, semantics, aggregation_method="base", log = True):
         pruned_atts = prune_attacks(obaf.atts, scores)
         
         # Compute extensions using pygarg solver
+        from pygarg.dung import solver
         extensions = solver.extension_enumeration(obaf.args, pruned_atts, semantics)
 
     if log:
         print(f"Pruned Attacks ({aggregation_method}): {pruned_atts}")
 
-    # Create a new OBAF with the pruned attacks for reporting
-    pruned_obaf = OBAF(obaf.args, pruned_atts, obaf.agents, obaf.votes)
+    # Create a new OBAF with the pruned attacks for reporting, the rest was validated with the input OBAF
+    pruned_obaf = obaf.with_attacks(pruned_atts)
 
     # pygarg may return "NO" when no extension is found.
     # Normalize it so this function always returns a list.
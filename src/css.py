@@ -1,49 +1,70 @@
+import numpy as np
 from OBAF import OBAF
 
 def run(extensions, obaf: OBAF, measure: str = 'U', agg: str = 'sum'):
-    if not extensions: 
+    if not extensions:
         return []
-            
-    res = []
-    for ext in extensions:
-        # Map extension: +1 if accepted, -1 if rejected
-        vec = {a: 1 if a in ext else -1 for a in obaf.args}
-        sc = []
-        
-        for v in obaf.votes.values():
-            # Calculate agreement (S) and disagreement (D)
-            s = sum(1 for a, val in v.items() if a in vec and val == vec[a])
-            d = -sum(1 for a, val in v.items() if a in vec and val == -vec[a])
-            
-            # Select measure
-            mesures = {'S': s, 'D': d, 'U': s + d}
-            sc.append(mesures.get(measure, s + d))
-        
-        # Aggregate scores
-        if agg == 'sum':
-            score = sum(sc)
-        elif agg == 'min':
-            score = min(sc)
-        elif agg == 'leximax':
-            score = sorted(sc, reverse=True)
-        elif agg == 'leximin':
-            score = sorted(sc)
-        else:
-            score = sorted(sc)
-            
-        res.append((ext, score))
-        
-    #find best score
-    mx_score = max(res, key=lambda x: x[1])[1]
-    
+
+    arg_idx = {a: i for i, a in enumerate(obaf.args)}
+
+    # Votes matrix V (agents x arguments): -1, 0 or +1
+    V = np.zeros((len(obaf.votes), len(obaf.args)), dtype=np.float64)
+    for row, v in enumerate(obaf.votes.values()):
+        for a, val in v.items():
+            i = arg_idx.get(a)
+            if i is not None:
+                V[row, i] = val
+
+    # Extensions matrix E (extensions x arguments): +1 if accepted, -1 if rejected
+    E = np.full((len(extensions), len(obaf.args)), -1, dtype=np.float64)
+    members = [[arg_idx[a] for a in ext if a in arg_idx] for ext in extensions]
+    rows = np.repeat(np.arange(len(extensions)), [len(cols) for cols in members])
+    E[rows, [i for cols in members for i in cols]] = 1
+
+    # Agreement (S) and disagreement (D) of every agent with every extension.
+    # E @ V.T gives agreements minus disagreements, and each agent's decided (non-neutral)
+    # votes give their sum, so a single matrix product is enough. It runs in floating point
+    # so NumPy hands it to BLAS, which is multi-threaded; the values are small exact integers.
+    u = (E @ V.T).astype(np.int64)
+    decided = np.abs(V).sum(axis=1).astype(np.int64)
+    s = (decided + u) // 2
+    d = (u - decided) // 2
+
+    # Select measure
+    if measure == 'S':
+        sc = s
+    elif measure == 'D':
+        sc = d
+    else:
+        sc = u
+
+    # Aggregate scores, one row per extension (a single column for sum and min)
+    if agg == 'sum':
+        scores = sc.sum(axis=1, keepdims=True)
+    elif agg == 'min':
+        scores = sc.min(axis=1, keepdims=True)
+    elif agg == 'leximax':
+        scores = np.sort(sc, axis=1)[:, ::-1]
+    else:
+        scores = np.sort(sc, axis=1)
+
+    # Keep the extensions with the lexicographically best row, narrowing the candidates
+    # column by column; for sum and min this is a single max over one column
+    best = np.arange(len(extensions))
+    for column in scores.T:
+        column = column[best]
+        best = best[column == column.max()]
+        if len(best) == 1:
+            break
+
     #return all extensions with best score
-    return [e for e, s in res if s == mx_score]
+    return [extensions[i] for i in best]
 
 if __name__ == "__main__":
     # Example usage
     from parser import read_apx
     from pygarg.dung import solver
-    obaf = read_apx("data/test/as_01.apx")  
+    obaf = read_apx("data/test/as_01.apx")
     extensions = solver.extension_enumeration(obaf.args, obaf.atts, "PR")
     best_extensions = run(extensions, obaf, measure='U', agg='sum')
     print("Best extensions:", best_extensions)
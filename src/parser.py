@@ -1,45 +1,81 @@
 import os
 import random
+import re
+import sys
+from functools import lru_cache
+from typing import NoReturn
 from OBAF import OBAF
-from pygarg.dung import solver
+
+# Regular expressions to parse APX lines, surrounding whitespace is absorbed by the patterns.
+# The content runs up to the last ')' of the line, so names may contain parentheses.
+ARG_PATTERN = re.compile(r"arg\s*\(\s*(.*?)\s*\)[^)]*$")
+ATT_PATTERN = re.compile(r"att\s*\(\s*([^,]*?)\s*,\s*([^,]*?)\s*\)[^)]*$")
+VOT_PATTERN = re.compile(r"vot\s*\(\s*([^,]*?)\s*,\s*([^,]*?)\s*,\s*([^,]*?)\s*\)[^)]*$")
+# Vote values accepted in vot lines, neutral votes are written by leaving the vote out
+VOTE_VALUES = {'-1': -1, '1': 1}
 
 def read_apx(file_path: str) -> OBAF:
     """
         Parse the arguments, attacks, and votes from the given file.
+        Parsing is cached on (path, modification time), each call still returns a new OBAF.
     """
     # Validate file extension
     if not file_path.endswith('.apx'):
         raise ValueError(f"File extension must be .apx, got: {file_path}")
 
+    args, atts, agents, votes = _read_apx_cached(file_path, os.path.getmtime(file_path))
+    # Build fresh containers every time, OBAF methods such as generate_votes change them in place.
+    # The content was validated when it was parsed, so validation is not run again.
+    return OBAF(
+        list(args),
+        [list(att) for att in atts],
+        list(agents),
+        {agent: dict(agent_votes) for agent, agent_votes in votes},
+        validate=False,
+    )
+
+@lru_cache(maxsize=16)
+def _read_apx_cached(file_path: str, mtime: float) -> tuple:
+    # mtime is not used here, it only belongs to the cache key so that edited files are parsed again.
+    # Only immutable data is cached so that no caller can change what the next one reads.
+    obaf = _read_apx_uncached(file_path)
+    return (
+        tuple(obaf.args),
+        tuple(tuple(att) for att in obaf.atts),
+        tuple(obaf.agents),
+        tuple((agent, tuple(agent_votes.items())) for agent, agent_votes in obaf.votes.items()),
+    )
+
+def _read_apx_uncached(file_path: str) -> OBAF:
     arguments = []
     attacks = []
     agents = None
+    # Votes are kept with their line number, they are validated once the whole file is read
     vote_entries = []
     with open(file_path, 'r') as f:
-        line_counter = 0
-        for line in f:
-            line_counter += 1
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-            
-            if line.startswith('arg'):
-                arg = _parse_arg(line, file_path, line_counter)
-                arguments.append(arg)
-            elif line.startswith('att'):
-                att = _parse_att(line, file_path, line_counter)
-                attacks.append(att)
-            elif line.startswith('agt'):
-                # Check for duplicate agent declaration lines
-                if agents is not None:
-                    raise ValueError(f"Duplicate agent declaration line, line {line_counter}, in {file_path}.")
-                agents = _parse_agt(line, file_path, line_counter)
-            elif line.startswith('vot'):
-                vote = _parse_vote(line, file_path, line_counter)
-                vote_entries.append((line_counter, vote))
-            else:
-                raise ValueError(f"Invalid line format: {line}. Expected lines to start with 'arg', 'att', 'agt', or 'vot', line {line_counter}, in {file_path}.")
+        # Read everything in one call; text mode already normalises newlines to '\n'
+        lines = f.read().split('\n')
+    for line_counter, line in enumerate(lines, 1):
+        line = line.strip()
+        # Skip empty lines
+        if not line:
+            continue
+        
+        # Vote lines come first since they are by far the most common
+        tag = line[:3]
+        if tag == 'vot':
+            vote_entries.append((line_counter, _parse_vote(line, file_path, line_counter)))
+        elif tag == 'arg':
+            arguments.append(_parse_arg(line, file_path, line_counter))
+        elif tag == 'att':
+            attacks.append(_parse_att(line, file_path, line_counter))
+        elif tag == 'agt':
+            # Check for duplicate agent declaration lines
+            if agents is not None:
+                raise ValueError(f"Duplicate agent declaration line, line {line_counter}, in {file_path}.")
+            agents = _parse_agt(line, file_path, line_counter)
+        else:
+            raise ValueError(f"Invalid line format: {line}. Expected lines to start with 'arg', 'att', 'agt', or 'vot', line {line_counter}, in {file_path}.")
 
     # Check for mandatory agent declaration line
     if agents is None:
@@ -47,26 +83,24 @@ def read_apx(file_path: str) -> OBAF:
 
     # Initialize votes dict with all agents and empty vote dicts
     votes = {agent: {} for agent in agents}
-    for vote_line_number, vote in vote_entries:
-        for agent, arguments_dict in vote.items():
-            # Check for votes from undeclared agents
-            if agent not in votes:
-                raise ValueError(f"Vote for undeclared agent: {agent}, line {vote_line_number}, in {file_path}.")
-            
-            for argument, vote_value in arguments_dict.items():
-                # Check for votes on non-existent arguments
-                if argument not in arguments:
-                    raise ValueError(f"Vote for non-existent argument: {argument}, line {vote_line_number}, in {file_path}.")
-                # Check for duplicate votes (same agent voting on the same argument twice)
-                if argument in votes[agent]:
-                    raise ValueError(f"Duplicate vote from agent '{agent}' for argument '{argument}', line {vote_line_number}, in {file_path}.")
-                votes[agent][argument] = vote_value
+    arguments_set = set(arguments)
+    for vote_line_number, (agent, argument, vote_value) in vote_entries:
+        agent_votes = votes.get(agent)
+        # Check for votes from undeclared agents
+        if agent_votes is None:
+            raise ValueError(f"Vote for undeclared agent: {agent}, line {vote_line_number}, in {file_path}.")
+        # Check for votes on non-existent arguments
+        if argument not in arguments_set:
+            raise ValueError(f"Vote for non-existent argument: {argument}, line {vote_line_number}, in {file_path}.")
+        # Check for duplicate votes (same agent voting on the same argument twice)
+        if argument in agent_votes:
+            raise ValueError(f"Duplicate vote from agent '{agent}' for argument '{argument}', line {vote_line_number}, in {file_path}.")
+        agent_votes[argument] = vote_value
             
     # Add neutral votes for any arguments that were not voted on by an agent
-    for agent in votes:
+    for agent_votes in votes.values():
         for argument in arguments:
-            if argument not in votes[agent]:
-                votes[agent][argument] = 0
+            agent_votes.setdefault(argument, 0)
     
     return OBAF(arguments, attacks, agents, votes)
 
@@ -74,23 +108,22 @@ def read_af_apx(file_path: str) -> tuple[list[str], list[list[str]]]:
     # Read the AF from the file
     args = []
     atts = []
+    # AF files only contain arguments and attacks
+    handlers = {'arg': (_parse_arg, args.append), 'att': (_parse_att, atts.append)}
     with open(file_path, 'r') as f:
-        line_counter = 0
-        for line in f:
-            line_counter += 1
-            line = line.strip()
-            # Skip empty lines
-            if not line:
-                continue
-            
-            if line.startswith('arg'):
-                arg = _parse_arg(line, file_path, line_counter)
-                args.append(arg)
-            elif line.startswith('att'):
-                att = _parse_att(line, file_path, line_counter)
-                atts.append(att)
-            else:
-                raise ValueError(f"Invalid line format: {line}. Expected lines to start with 'arg', or 'att', line {line_counter}, in {file_path}.")
+        # Read everything in one call, as in read_apx
+        lines = f.read().split('\n')
+    for line_counter, line in enumerate(lines, 1):
+        line = line.strip()
+        # Skip empty lines
+        if not line:
+            continue
+        
+        handler = handlers.get(line[:3])
+        if handler is None:
+            raise ValueError(f"Invalid line format: {line}. Expected lines to start with 'arg', or 'att', line {line_counter}, in {file_path}.")
+        parse, collect = handler
+        collect(parse(line, file_path, line_counter))
             
     return args, atts
 
@@ -106,18 +139,16 @@ def write_apx(file_path: str, obaf: OBAF) -> None:
     if output_dir:
         os.makedirs(output_dir, exist_ok=True)
 
+    # Build every line first and write the joined content in one call
+    lines = [f"agt({', '.join(obaf.agents)}).\n"]
+    lines += [f"arg({arg}).\n" for arg in obaf.args]
+    lines += [f"att({attacker}, {target}).\n" for attacker, target in obaf.atts]
+    for agent, arguments_dict in obaf.votes.items():
+        # Skip neutral votes since they are equivalent to missing votes
+        lines += [f"vot({agent}, {argument}, {vote}).\n" for argument, vote in arguments_dict.items() if vote != 0]
+    content = "".join(lines)
     with open(file_path, 'w') as f:
-        f.write(f"agt({', '.join(obaf.agents)}).\n")
-        for arg in obaf.args:
-            f.write(f"arg({arg}).\n")
-        for att in obaf.atts:
-            f.write(f"att({att[0]}, {att[1]}).\n")
-        for agent, arguments_dict in obaf.votes.items():
-            for argument, vote in arguments_dict.items():
-                # Skip neutral votes since they are equivalent to missing votes
-                if vote == 0:
-                    continue
-                f.write(f"vot({agent}, {argument}, {vote}).\n")
+        f.write(content)
 
     print(f"Successfully wrote OBAF to file: {file_path}")
 
@@ -137,6 +168,7 @@ def af_to_obaf(file_path: str, semantics: str, reliability: float, number_of_age
     args, atts = read_af_apx(file_path)
 
     # Compute extensions using pygarg solver
+    from pygarg.dung import solver
     computed_extensions = solver.extension_enumeration(args, atts, semantics)
     # Pick a random extension as the truth for generating votes.
     if computed_extensions:
@@ -167,55 +199,60 @@ def af_to_obaf(file_path: str, semantics: str, reliability: float, number_of_age
 def _parse_arg(line: str, file_path: str, line_number: int) -> str:
     """
         Parse the argument from the given line and return it as a string.
+        Names are interned, the same argument comes back in every attack and vote line.
     """
-    # Extract the content inside the parentheses
-    content = line[line.find('(') + 1:line.rfind(')')]
-    arg = content.strip()
-    if not arg:
-        raise ValueError(f"Invalid line format: {line}. Expected format: 'arg(argument)', line {line_number}, in {file_path}.")
-    return arg
+    match = ARG_PATTERN.match(line)
+    argument = match.group(1) if match is not None else None
+    if not argument:
+        _raise_invalid_format(line, "arg(argument)", file_path, line_number)
+    return sys.intern(argument)
 
 def _parse_att(line: str, file_path: str, line_number: int) -> list[str]:
     """
         Parse the attack from the given line and return it as a list of two strings: [attacker, target].
     """
-    # Extract the content inside the parentheses
-    content = line[line.find('(') + 1:line.rfind(')')]
-    parts = [p.strip() for p in content.split(',')]
-    if len(parts) != 2:
-        raise ValueError(f"Invalid line format: {line}. Expected format: 'att(attacker, target)', line {line_number}, in {file_path}.")
-    return parts
+    match = ATT_PATTERN.match(line)
+    if match is None:
+        _raise_invalid_format(line, "att(attacker, target)", file_path, line_number)
+    return [sys.intern(name) for name in match.groups()]
 
 def _parse_agt(line: str, file_path: str, line_number: int) -> list[str]:
     """
         Parse the voting agents from the given line and return them as a list of strings.
     """
     content = line[line.find('(') + 1:line.rfind(')')]
-    parts = [p.strip() for p in content.split(',')]
+    parts = [sys.intern(p.strip()) for p in content.split(',')]
     if not parts or any(not part for part in parts):
-        raise ValueError(f"Invalid line format: {line}. Expected format: 'agt(agent1, agent2, ...)', line {line_number}, in {file_path}.")
+        _raise_invalid_format(line, "agt(agent1, agent2, ...)", file_path, line_number)
     if len(set(parts)) != len(parts):
         raise ValueError(f"Duplicate agent names in declaration line, line {line_number}, in {file_path}.")
     return parts
 
-def _parse_vote(line: str, file_path: str, line_number: int) -> dict[str, dict[str, int]]:
+def _parse_vote(line: str, file_path: str, line_number: int) -> tuple[str, str, int]:
     """
-        Parse the vote from the given line and return a dict of this form:
-        {
-            agent: {
-                argument: vote
-            }
-        }
+        Parse the vote from the given line and return it as a tuple: (agent, argument, vote).
     """
-    # Extract the content inside the parentheses
-    content = line[line.find('(') + 1:line.rfind(')')]
-    parts = [p.strip() for p in content.split(',')]
-    if len(parts) != 3:
-        raise ValueError(f"Invalid line format: {line}. Expected format: 'vot(agent, argument, vote)'")
-    agent, argument, vote_str = parts
+    match = VOT_PATTERN.match(line)
+    if match is None:
+        _raise_invalid_format(line, "vot(agent, argument, vote)", file_path, line_number)
+    agent, argument, vote_str = match.groups()
+
+    # Check if the vote is a valid value, the lookup also converts it
+    vote = VOTE_VALUES.get(vote_str)
+    if vote is None:
+        _raise_invalid_vote_value(vote_str, file_path, line_number)
+
+    return sys.intern(agent), sys.intern(argument), vote
 
-    # Check if the vote is a valid value
-    if vote_str not in ['-1', '1']:
-        raise ValueError(f"Invalid vote value: {vote_str}. Expected '-1', or '1', line {line_number}, in {file_path}.")
+def _raise_invalid_format(line: str, expected_format: str, file_path: str, line_number: int) -> NoReturn:
+    """
+        Raise the error for a line that does not have its expected format.
+        Errors are built here rather than in the parse helpers, which run for every line.
+    """
+    raise ValueError(f"Invalid line format: {line}. Expected format: '{expected_format}', line {line_number}, in {file_path}.")
 
-    return {agent: {argument: int(vote_str)}}
\ No newline at end of file
+def _raise_invalid_vote_value(vote_str: str, file_path: str, line_number: int) -> NoReturn:
+    """
+        Raise the error for a vote value other than '-1' or '1'.
+    """
+    raise ValueError(f"Invalid vote value: {vote_str}. Expected '-1', or '1', line {line_number}, in {file_path}.")
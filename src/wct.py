@@ -5,6 +5,9 @@ from statistics import median
 from parser import read_apx
 from pygarg.dung import solver
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+
 
 def compute_force(agg: dict[str, list[int]]):
     """
@@ -111,11 +114,9 @@ def main():
     ap.add_argument("--show-input", action="store_true")
     cli = ap.parse_args()
 
-    repo_root = Path(__file__).resolve().parent.parent
-    data_dir = repo_root / "data"
     candidate = Path(cli.file)
     if not candidate.is_absolute():
-        in_data = data_dir / cli.file
+        in_data = DATA_DIR / cli.file
         candidate = in_data if in_data.exists() else candidate
 
     obaf = read_apx(str(candidate.resolve()))